@@ -0,0 +1,85 @@
+import { GET } from "@/app/api/form/stats/route"
+import { NextRequest } from "next/server"
+import jest from "jest"
+
+// Mock the Prisma client
+jest.mock("@/lib/prisma", () => ({
+  prisma: {
+    submissionStat: { findMany: jest.fn() },
+    statsWatermark: { findUnique: jest.fn() },
+  },
+}))
+
+describe("/api/form/stats", () => {
+  const mockPrisma = require("@/lib/prisma").prisma
+
+  beforeEach(() => {
+    jest.clearAllMocks()
+  })
+
+  test("should reject unknown dimensions", async () => {
+    const request = new NextRequest("http://localhost:3000/api/form/stats?dimension=aadhaar_number")
+
+    const response = await GET(request)
+    const data = await response.json()
+
+    expect(response.status).toBe(400)
+    expect(data.error).toBe("Unknown dimension")
+    expect(mockPrisma.submissionStat.findMany).not.toHaveBeenCalled()
+  })
+
+  test("should group precomputed counts by dimension", async () => {
+    mockPrisma.submissionStat.findMany.mockResolvedValue([
+      { dimension: "state", value: "Karnataka", count: BigInt(12) },
+      { dimension: "state", value: "Kerala", count: BigInt(3) },
+      { dimension: "total", value: "all", count: BigInt(15) },
+    ])
+    mockPrisma.statsWatermark.findUnique.mockResolvedValue({
+      jobName: "submission_stats",
+      runAt: "2025-01-08T12:00:00.000Z",
+    })
+
+    const request = new NextRequest("http://localhost:3000/api/form/stats")
+
+    const response = await GET(request)
+    const data = await response.json()
+
+    expect(response.status).toBe(200)
+    expect(data.stats).toEqual({
+      state: { Karnataka: 12, Kerala: 3 },
+      total: { all: 15 },
+    })
+    expect(data.updatedAt).toBe("2025-01-08T12:00:00.000Z")
+  })
+
+  test("should filter by a single dimension", async () => {
+    mockPrisma.submissionStat.findMany.mockResolvedValue([
+      { dimension: "submission_status", value: "submitted", count: BigInt(7) },
+    ])
+    mockPrisma.statsWatermark.findUnique.mockResolvedValue(null)
+
+    const request = new NextRequest("http://localhost:3000/api/form/stats?dimension=submission_status")
+
+    const response = await GET(request)
+    const data = await response.json()
+
+    expect(response.status).toBe(200)
+    expect(mockPrisma.submissionStat.findMany).toHaveBeenCalledWith(
+      expect.objectContaining({ where: { dimension: "submission_status" } }),
+    )
+    expect(data.stats).toEqual({ submission_status: { submitted: 7 } })
+    expect(data.updatedAt).toBeNull()
+  })
+
+  test("should handle database errors", async () => {
+    mockPrisma.submissionStat.findMany.mockRejectedValue(new Error("connection refused"))
+
+    const request = new NextRequest("http://localhost:3000/api/form/stats")
+
+    const response = await GET(request)
+    const data = await response.json()
+
+    expect(response.status).toBe(500)
+    expect(data.error).toBe("Internal server error")
+  })
+})
@@ -0,0 +1,85 @@
+import { GET } from "@/app/api/form/structure/[file]/route"
+import { NextRequest } from "next/server"
+import jest from "jest"
+
+// Mock the published files in public/
+jest.mock("fs/promises", () => ({
+  readFile: jest.fn(),
+}))
+
+const FILE = "udyam-form-structure.0123456789abcdef.json"
+
+describe("/api/form/structure/[file]", () => {
+  const mockReadFile = require("fs/promises").readFile
+
+  const publish = (variants: string[]) => {
+    mockReadFile.mockImplementation(async (filePath: string) => {
+      const variant = variants.find((name) => filePath.endsWith(`/${name}`))
+      if (!variant) throw Object.assign(new Error("not found"), { code: "ENOENT" })
+      return Buffer.from(variant)
+    })
+  }
+
+  const fetchStructure = (acceptEncoding: string | null, file = FILE) => {
+    const headers: Record<string, string> = acceptEncoding === null ? {} : { "accept-encoding": acceptEncoding }
+    const request = new NextRequest(`http://localhost:3000/api/form/structure/${file}`, { headers })
+    return GET(request, { params: { file } })
+  }
+
+  beforeEach(() => {
+    jest.clearAllMocks()
+    publish([FILE, `${FILE}.gz`, `${FILE}.br`])
+  })
+
+  test("should prefer brotli when the client accepts it", async () => {
+    const response = await fetchStructure("gzip, br")
+
+    expect(response.status).toBe(200)
+    expect(response.headers.get("content-encoding")).toBe("br")
+    expect(response.headers.get("vary")).toBe("Accept-Encoding")
+    expect(await response.text()).toBe(`${FILE}.br`)
+  })
+
+  test("should not send brotli when it is refused next to a wildcard", async () => {
+    const response = await fetchStructure("br;q=0, *")
+
+    expect(response.status).toBe(200)
+    expect(response.headers.get("content-encoding")).toBe("gzip")
+    expect(await response.text()).toBe(`${FILE}.gz`)
+  })
+
+  test("should serve the identity file when gzip is refused", async () => {
+    const response = await fetchStructure("gzip;q=0")
+
+    expect(response.status).toBe(200)
+    expect(response.headers.get("content-encoding")).toBeNull()
+    expect(await response.text()).toBe(FILE)
+  })
+
+  test("should fall back to gzip when the brotli variant is missing", async () => {
+    publish([FILE, `${FILE}.gz`])
+
+    const response = await fetchStructure("br, gzip")
+
+    expect(response.status).toBe(200)
+    expect(response.headers.get("content-encoding")).toBe("gzip")
+    expect(await response.text()).toBe(`${FILE}.gz`)
+  })
+
+  test("should reject file names that are not published structures", async () => {
+    const response = await fetchStructure("gzip", "..%2F.env")
+    const data = await response.json()
+
+    expect(response.status).toBe(404)
+    expect(data.error).toBe("Form structure not found")
+    expect(mockReadFile).not.toHaveBeenCalled()
+  })
+
+  test("should return 404 when no variant is published", async () => {
+    publish([])
+
+    const response = await fetchStructure(null)
+
+    expect(response.status).toBe(404)
+  })
+})
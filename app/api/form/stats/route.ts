@@ -0,0 +1,40 @@
+import { type NextRequest, NextResponse } from "next/server"
+import { prisma } from "@/lib/prisma"
+
+const DIMENSIONS = ["total", "state", "district", "submission_status", "business_type"]
+
+export async function GET(request: NextRequest) {
+  try {
+    const { searchParams } = new URL(request.url)
+    const dimension = searchParams.get("dimension")
+
+    if (dimension && !DIMENSIONS.includes(dimension)) {
+      return NextResponse.json({ error: "Unknown dimension" }, { status: 400 })
+    }
+
+    // Counts are maintained by scripts/aggregate-submissions.py
+    const stats = await prisma.submissionStat.findMany({
+      where: dimension ? { dimension } : undefined,
+      orderBy: [{ dimension: "asc" }, { count: "desc" }],
+    })
+
+    const grouped: Record<string, Record<string, number>> = {}
+    for (const stat of stats) {
+      grouped[stat.dimension] = grouped[stat.dimension] || {}
+      grouped[stat.dimension][stat.value] = Number(stat.count)
+    }
+
+    const watermark = await prisma.statsWatermark.findUnique({
+      where: { jobName: "submission_stats" },
+    })
+
+    return NextResponse.json({
+      stats: grouped,
+      // run_at is refreshed on every aggregation run, including ones without changes
+      updatedAt: watermark?.runAt ?? null,
+    })
+  } catch (error) {
+    console.error("Get submission stats API error:", error)
+    return NextResponse.json({ error: "Internal server error" }, { status: 500 })
+  }
+}
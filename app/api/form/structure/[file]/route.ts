@@ -0,0 +1,64 @@
+import { type NextRequest, NextResponse } from "next/server"
+import { readFile } from "fs/promises"
+import path from "path"
+
+const PUBLIC_DIR = path.join(process.cwd(), "public")
+const HASHED_FILE = /^udyam-form-structure\.[0-9a-f]{16}\.json$/
+
+// Encodings the client accepts, honouring q-values (q=0 means "not acceptable")
+const acceptedEncodings = (header: string): Set<string> => {
+  const accepted = new Set<string>()
+  const rejected = new Set<string>()
+
+  for (const entry of header.split(",")) {
+    const [rawName, ...params] = entry.toLowerCase().split(";")
+    const name = rawName.trim()
+    if (!name) continue
+
+    const qParam = params.map((param) => param.trim()).find((param) => param.startsWith("q="))
+    const q = qParam ? Number.parseFloat(qParam.slice(2)) : 1
+    if (Number.isNaN(q) || q <= 0) rejected.add(name)
+    else accepted.add(name)
+  }
+
+  if (accepted.has("*")) {
+    for (const encoding of ["br", "gzip"]) {
+      if (!rejected.has(encoding)) accepted.add(encoding)
+    }
+  }
+  for (const encoding of rejected) accepted.delete(encoding)
+  return accepted
+}
+
+// Serves the precompressed variants written by publish_json in scripts/scrape-udyam-form.py
+export async function GET(request: NextRequest, { params }: { params: { file: string } }) {
+  const { file } = params
+
+  if (!HASHED_FILE.test(file)) {
+    return NextResponse.json({ error: "Form structure not found" }, { status: 404 })
+  }
+
+  const accepted = acceptedEncodings(request.headers.get("accept-encoding") || "")
+  const candidates: Array<[string, string]> = []
+  if (accepted.has("br")) candidates.push(["br", `${file}.br`])
+  if (accepted.has("gzip")) candidates.push(["gzip", `${file}.gz`])
+  candidates.push(["identity", file])
+
+  for (const [encoding, variant] of candidates) {
+    try {
+      const body = await readFile(path.join(PUBLIC_DIR, variant))
+      const headers: Record<string, string> = {
+        "Content-Type": "application/json; charset=utf-8",
+        "Cache-Control": "public, max-age=31536000, immutable",
+        Vary: "Accept-Encoding",
+      }
+      if (encoding !== "identity") headers["Content-Encoding"] = encoding
+
+      return new NextResponse(body, { headers })
+    } catch {
+      // Variant not published (e.g. brotli unavailable at publish time), try the next one
+    }
+  }
+
+  return NextResponse.json({ error: "Form structure not found" }, { status: 404 })
+}
@@ -94,7 +94,11 @@ export async function GET(request: NextRequest) {
       take: 10,
     })
 
-    const total = await prisma.udyamSubmission.count()
+    // Read the precomputed total; count() only until the aggregation job has run once
+    const totalStat = await prisma.submissionStat.findUnique({
+      where: { dimension_value: { dimension: "total", value: "all" } },
+    })
+    const total = totalStat ? Number(totalStat.count) : await prisma.udyamSubmission.count()
 
     return NextResponse.json({
       submissions,
@@ -65,8 +65,25 @@ export const validateName = (name: string): boolean => {
 }
 
 // Form data loading utility
+const loadHashedFormStructure = async (): Promise<UdyamFormStructure | null> => {
+  try {
+    const manifestResponse = await fetch("/udyam-form-structure.manifest.json", { cache: "no-cache" })
+    if (!manifestResponse.ok) return null
+
+    const manifest = await manifestResponse.json()
+    const response = await fetch(`/api/form/structure/${manifest.file}`)
+    return response.ok ? await response.json() : null
+  } catch {
+    return null
+  }
+}
+
 export const loadFormStructure = async (): Promise<UdyamFormStructure> => {
   try {
+    // Prefer the precompressed, immutable copy; fall back to the fixed-name file
+    const hashed = await loadHashedFormStructure()
+    if (hashed) return hashed
+
     const response = await fetch("/udyam-form-structure.json")
     if (!response.ok) {
       throw new Error("Failed to load form structure")
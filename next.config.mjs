@@ -9,6 +9,19 @@ const nextConfig = {
   images: {
     unoptimized: true,
   },
+  async headers() {
+    return [
+      {
+        // The manifest points at the current content-hashed form structure
+        source: "/udyam-form-structure.manifest.json",
+        headers: [{ key: "Cache-Control", value: "no-cache" }],
+      },
+      {
+        source: "/:file(udyam-form-structure\\.[0-9a-f]{16}\\.json)",
+        headers: [{ key: "Cache-Control", value: "public, max-age=31536000, immutable" }],
+      },
+    ]
+  },
 }
 
 export default nextConfig
\ No newline at end of file
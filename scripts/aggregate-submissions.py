@@ -0,0 +1,176 @@
+import os
+import time
+from collections import Counter
+
+DIMENSIONS = ["state", "district", "submission_status", "business_type"]
+UNKNOWN_VALUE = "unknown"
+TOTAL_KEY = ("total", "all")
+
+class SubmissionAggregator:
+    def __init__(self, database_url=None, job_name="submission_stats", batch_size=5000, safety_lag_seconds=5):
+        self.database_url = database_url or os.environ.get("DATABASE_URL")
+        self.job_name = job_name
+        self.batch_size = batch_size
+        # Rows newer than this are left for the next run, so a transaction that
+        # commits late with an older updated_at is not skipped by the watermark.
+        # It must exceed the longest write transaction (API inserts are short,
+        # backfills are not), see STATS_SAFETY_LAG_SECONDS in main()
+        self.safety_lag_seconds = safety_lag_seconds
+
+    def connect(self):
+        """Open a database connection"""
+        if not self.database_url:
+            raise RuntimeError("DATABASE_URL is not set")
+        import psycopg2
+        return psycopg2.connect(self.database_url)
+
+    def load_watermark(self, cursor):
+        """Return the (updated_at, id) pair of the last processed change"""
+        cursor.execute(
+            "SELECT last_updated_at, last_submission_id FROM udyam_stats_watermark WHERE job_name = %s",
+            (self.job_name,),
+        )
+        row = cursor.fetchone()
+        if not row or row[0] is None:
+            return None, ""
+        return row[0], row[1] or ""
+
+    def fetch_changes(self, cursor, watermark_at, watermark_id):
+        """Fetch the next batch of changed submissions with their previously counted values"""
+        columns = ", ".join(f"s.{dim}" for dim in DIMENSIONS)
+        previous = ", ".join(f"r.{dim}" for dim in DIMENSIONS)
+        query = f"""
+            SELECT s.id, s.updated_at, {columns}, r.submission_id IS NOT NULL, {previous}
+            FROM udyam_submissions s
+            LEFT JOIN udyam_submission_stats_rows r ON r.submission_id = s.id
+            WHERE s.updated_at < NOW() - make_interval(secs => %s)
+              AND (%s::timestamptz IS NULL OR (s.updated_at, s.id) > (%s::timestamptz, %s))
+            ORDER BY s.updated_at, s.id
+            LIMIT %s
+        """
+        cursor.execute(query, (self.safety_lag_seconds, watermark_at, watermark_at, watermark_id, self.batch_size))
+        return cursor.fetchall()
+
+    def compute_deltas(self, rows):
+        """Turn changed rows into per-(dimension, value) count deltas"""
+        deltas = Counter()
+        width = len(DIMENSIONS)
+
+        for row in rows:
+            current = row[2:2 + width]
+            seen = row[2 + width]
+            previous = row[3 + width:3 + 2 * width]
+
+            if not seen:
+                deltas[TOTAL_KEY] += 1
+
+            for index, dim in enumerate(DIMENSIONS):
+                new_value = current[index] or UNKNOWN_VALUE
+                if seen:
+                    old_value = previous[index] or UNKNOWN_VALUE
+                    if old_value == new_value:
+                        continue
+                    deltas[(dim, old_value)] -= 1
+                deltas[(dim, new_value)] += 1
+
+        return {key: delta for key, delta in deltas.items() if delta != 0}
+
+    def apply_deltas(self, cursor, deltas):
+        """Upsert count deltas into the summary table"""
+        for (dimension, value), delta in deltas.items():
+            cursor.execute(
+                """
+                INSERT INTO udyam_submission_stats (dimension, value, count, updated_at)
+                VALUES (%s, %s, %s, NOW())
+                ON CONFLICT (dimension, value)
+                DO UPDATE SET count = udyam_submission_stats.count + EXCLUDED.count, updated_at = NOW()
+                """,
+                (dimension, value, delta),
+            )
+
+    def record_rows(self, cursor, rows):
+        """Remember the dimension values each submission is now counted under"""
+        width = len(DIMENSIONS)
+        columns = ", ".join(DIMENSIONS)
+        placeholders = ", ".join(["%s"] * (width + 1))
+        updates = ", ".join(f"{dim} = EXCLUDED.{dim}" for dim in DIMENSIONS)
+        for row in rows:
+            cursor.execute(
+                f"""
+                INSERT INTO udyam_submission_stats_rows (submission_id, {columns})
+                VALUES ({placeholders})
+                ON CONFLICT (submission_id) DO UPDATE SET {updates}
+                """,
+                (row[0], *row[2:2 + width]),
+            )
+
+    def save_watermark(self, cursor, last_row, processed):
+        """Advance the watermark to the last processed change"""
+        cursor.execute(
+            """
+            INSERT INTO udyam_stats_watermark (job_name, last_updated_at, last_submission_id, rows_processed, run_at)
+            VALUES (%s, %s, %s, %s, NOW())
+            ON CONFLICT (job_name) DO UPDATE SET
+                last_updated_at = EXCLUDED.last_updated_at,
+                last_submission_id = EXCLUDED.last_submission_id,
+                rows_processed = udyam_stats_watermark.rows_processed + EXCLUDED.rows_processed,
+                run_at = NOW()
+            """,
+            (self.job_name, last_row[1], last_row[0], processed),
+        )
+
+    def touch_watermark(self, cursor):
+        """Record that the job ran, even when no submissions changed"""
+        cursor.execute(
+            """
+            INSERT INTO udyam_stats_watermark (job_name, run_at)
+            VALUES (%s, NOW())
+            ON CONFLICT (job_name) DO UPDATE SET run_at = NOW()
+            """,
+            (self.job_name,),
+        )
+
+    def run(self):
+        """Process all pending changes batch by batch; each batch commits atomically"""
+        start = time.time()
+        total_rows = 0
+        connection = self.connect()
+
+        try:
+            while True:
+                with connection:
+                    with connection.cursor() as cursor:
+                        watermark_at, watermark_id = self.load_watermark(cursor)
+                        rows = self.fetch_changes(cursor, watermark_at, watermark_id)
+                        if not rows:
+                            break
+
+                        self.apply_deltas(cursor, self.compute_deltas(rows))
+                        self.record_rows(cursor, rows)
+                        self.save_watermark(cursor, rows[-1], len(rows))
+
+                total_rows += len(rows)
+                print(f"Aggregated batch of {len(rows)} submissions")
+
+                if len(rows) < self.batch_size:
+                    break
+
+            # run_at tells dashboards how fresh the counts are, also on a quiet table
+            with connection:
+                with connection.cursor() as cursor:
+                    self.touch_watermark(cursor)
+        finally:
+            connection.close()
+
+        print(f"Aggregation completed: {total_rows} changed submissions in {time.time() - start:.2f}s")
+        return total_rows
+
+def main():
+    aggregator = SubmissionAggregator(
+        batch_size=int(os.environ.get("STATS_BATCH_SIZE", "5000")),
+        safety_lag_seconds=float(os.environ.get("STATS_SAFETY_LAG_SECONDS", "5")),
+    )
+    aggregator.run()
+
+if __name__ == "__main__":
+    main()
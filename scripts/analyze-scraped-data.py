@@ -1,14 +1,13 @@
 import json
-import re
 
-def analyze_scraped_data():
+def analyze_scraped_data(path="public/udyam-scraped-data.json"):
     """Analyze the scraped data and generate insights"""
     
     try:
-        with open("public/udyam-scraped-data.json", "r", encoding="utf-8") as f:
+        with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
     except FileNotFoundError:
-        print("Scraped data file not found. Please run scrape-udyam-detailed.py first.")
+        print(f"Scraped data file {path} not found. Please run scrape-udyam-detailed.py first.")
         return
     
     print("=== UDYAM FORM ANALYSIS ===\n")
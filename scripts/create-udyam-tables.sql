@@ -51,3 +51,35 @@ CREATE INDEX IF NOT EXISTS idx_udyam_aadhaar ON udyam_submissions(aadhaar_number
 CREATE INDEX IF NOT EXISTS idx_udyam_status ON udyam_submissions(submission_status);
 CREATE INDEX IF NOT EXISTS idx_otp_aadhaar ON otp_verifications(aadhaar_number);
 CREATE INDEX IF NOT EXISTS idx_otp_expires ON otp_verifications(expires_at);
+
+-- Index backing the latest-submissions listing and the aggregation watermark scan
+CREATE INDEX IF NOT EXISTS idx_udyam_created_at ON udyam_submissions(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_udyam_updated_at ON udyam_submissions(updated_at, id);
+
+-- Precomputed submission counts, maintained by scripts/aggregate-submissions.py
+-- dimension is one of: total, state, district, submission_status, business_type
+CREATE TABLE IF NOT EXISTS udyam_submission_stats (
+    dimension TEXT NOT NULL,
+    value TEXT NOT NULL,
+    count BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (dimension, value)
+);
+
+-- Dimension values each submission was last counted under, so updates can be re-bucketed
+CREATE TABLE IF NOT EXISTS udyam_submission_stats_rows (
+    submission_id TEXT PRIMARY KEY,
+    state TEXT,
+    district TEXT,
+    submission_status TEXT,
+    business_type TEXT
+);
+
+-- Change watermark of the aggregation job
+CREATE TABLE IF NOT EXISTS udyam_stats_watermark (
+    job_name TEXT PRIMARY KEY,
+    last_updated_at TIMESTAMP WITH TIME ZONE,
+    last_submission_id TEXT,
+    rows_processed BIGINT DEFAULT 0,
+    run_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
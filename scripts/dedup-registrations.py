@@ -0,0 +1,350 @@
+import argparse
+import bisect
+import csv
+import hashlib
+import heapq
+import json
+import math
+import os
+import time
+from array import array
+from datetime import datetime, timedelta
+
+FILTER_FILE = "bloom.bin"
+KEYS_FILE = "keys.bin"
+META_FILE = "meta.json"
+MASK_64 = (1 << 64) - 1
+SORT_CHUNK_SIZE = 1000000
+
+def normalize_pair(aadhaar, pan):
+    """Canonical form of an Aadhaar/PAN pair as it is stored by the submit API"""
+    aadhaar = "".join(ch for ch in (aadhaar or "") if ch.isdigit())
+    pan = (pan or "").strip().upper()
+    return aadhaar, pan
+
+def merge_sorted(runs):
+    """Merge sorted fingerprint arrays into one deduplicated array("Q")"""
+    merged = array("Q")
+    previous = None
+    for value in heapq.merge(*runs):
+        if value != previous:
+            merged.append(value)
+            previous = value
+    return merged
+
+class SortedRuns:
+    """Collects fingerprints as sorted array("Q") runs instead of one list of Python ints"""
+
+    def __init__(self, chunk_size=SORT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.runs = []
+        self.pending = array("Q")
+
+    def add(self, fingerprint):
+        self.pending.append(fingerprint)
+        if len(self.pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.runs.append(array("Q", sorted(self.pending)))
+            self.pending = array("Q")
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs) + len(self.pending)
+
+    def merged_with(self, existing=None):
+        self.flush()
+        return merge_sorted(([existing] if existing else []) + self.runs)
+
+class BloomFilter:
+    def __init__(self, num_bits, num_hashes, bits=None, count=0):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+        self.count = count
+
+    @classmethod
+    def for_capacity(cls, capacity, error_rate=0.001):
+        """Size the filter for the expected number of keys and false positive rate"""
+        capacity = max(capacity, 1)
+        num_bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+        return cls(num_bits, num_hashes)
+
+    def positions(self, digest):
+        """Bit positions for a 128-bit digest using double hashing"""
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+        return [((h1 + i * h2) & MASK_64) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, digest):
+        for pos in self.positions(digest):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, digest):
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self.positions(digest))
+
+class RegistrationDedupIndex:
+    def __init__(self, index_dir="data/dedup-index", database_url=None, hash_key=None, error_rate=0.001,
+                 safety_lag_seconds=300):
+        self.index_dir = index_dir
+        self.database_url = database_url or os.environ.get("DATABASE_URL")
+        # Keyed hashing keeps raw Aadhaar/PAN values out of the index files; without
+        # a key the 10^12 Aadhaar space could be brute-forced offline
+        key = hash_key if hash_key is not None else os.environ.get("DEDUP_HASH_KEY", "")
+        self.hash_key = key.encode("utf-8")[:64]
+        # Import transactions stamp created_at at their start; rows younger than
+        # the lag are left for the next update so an open import isn't skipped
+        self.safety_lag_seconds = safety_lag_seconds
+        self.error_rate = error_rate
+        self.bloom = None
+        self.keys = array("Q")
+        self.meta = {}
+
+    def digest(self, aadhaar, pan):
+        """128-bit keyed digest of a normalized Aadhaar/PAN pair"""
+        aadhaar, pan = normalize_pair(aadhaar, pan)
+        return hashlib.blake2b(f"{aadhaar}|{pan}".encode("utf-8"), digest_size=16, key=self.hash_key).digest()
+
+    def key_id(self):
+        """Identifies the hash key, so an index is never checked with a different key"""
+        return hashlib.blake2b(b"dedup-key-id", digest_size=8, key=self.hash_key).hexdigest()
+
+    def require_hash_key(self):
+        if not self.hash_key:
+            raise RuntimeError("DEDUP_HASH_KEY is not set; refusing to write an unkeyed Aadhaar/PAN index")
+
+    @staticmethod
+    def fingerprint(digest):
+        """64-bit fingerprint kept in the sorted key file"""
+        return int.from_bytes(digest[:8], "big")
+
+    def connect(self):
+        """Open a database connection"""
+        if not self.database_url:
+            raise RuntimeError("DATABASE_URL is not set")
+        import psycopg2
+        return psycopg2.connect(self.database_url)
+
+    def iter_submissions(self, connection, after_at=None, after_id=""):
+        """Stream (aadhaar, pan, created_at, id) rows newer than the given watermark"""
+        with connection.cursor(name="dedup_scan") as cursor:
+            cursor.itersize = 50000
+            cursor.execute(
+                """
+                SELECT aadhaar_number, pan_number, created_at, id
+                FROM udyam_submissions
+                WHERE created_at < NOW() - make_interval(secs => %s)
+                  AND (%s::timestamptz IS NULL OR (created_at, id) > (%s::timestamptz, %s))
+                ORDER BY created_at, id
+                """,
+                (self.safety_lag_seconds, after_at, after_at, after_id),
+            )
+            for row in cursor:
+                yield row
+
+    def count_submissions(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM udyam_submissions")
+            return cursor.fetchone()[0]
+
+    def build(self, capacity=None):
+        """Build the filter and sorted key file from scratch"""
+        self.require_hash_key()
+        start = time.time()
+        connection = self.connect()
+        try:
+            existing = self.count_submissions(connection)
+            # Leave headroom so incremental updates don't degrade the false positive rate
+            capacity = capacity or max(existing * 2, 1000000)
+            self.bloom = BloomFilter.for_capacity(capacity, self.error_rate)
+            fingerprints = SortedRuns()
+            last_row = None
+
+            for row in self.iter_submissions(connection):
+                digest = self.digest(row[0], row[1])
+                self.bloom.add(digest)
+                fingerprints.add(self.fingerprint(digest))
+                last_row = row
+        finally:
+            connection.close()
+
+        self.keys = fingerprints.merged_with()
+        self.meta = {
+            "key_id": self.key_id(),
+            "capacity": capacity,
+            "error_rate": self.error_rate,
+            "num_bits": self.bloom.num_bits,
+            "num_hashes": self.bloom.num_hashes,
+            "count": self.bloom.count,
+            "watermark_at": last_row[2].isoformat() if last_row else None,
+            "watermark_id": last_row[3] if last_row else "",
+        }
+        self.save()
+        print(f"Built dedup index with {self.bloom.count} submissions in {time.time() - start:.2f}s")
+
+    def update(self):
+        """Add submissions created since the last build or update"""
+        self.require_hash_key()
+        start = time.time()
+        self.load()
+        connection = self.connect()
+        new_fingerprints = SortedRuns()
+        last_row = None
+        try:
+            for row in self.iter_submissions(connection, self.meta["watermark_at"], self.meta["watermark_id"]):
+                digest = self.digest(row[0], row[1])
+                self.bloom.add(digest)
+                new_fingerprints.add(self.fingerprint(digest))
+                last_row = row
+        finally:
+            connection.close()
+
+        if not last_row:
+            print("Dedup index is up to date")
+            return 0
+
+        # Only the new fingerprints are sorted; they are merged into the existing run
+        self.keys = new_fingerprints.merged_with(self.keys)
+        self.meta["count"] = self.bloom.count
+        self.meta["watermark_at"] = last_row[2].isoformat()
+        self.meta["watermark_id"] = last_row[3]
+        self.save()
+
+        if self.bloom.count > self.meta["capacity"]:
+            print("Warning: dedup index is over capacity, run a full build to restore the false positive rate")
+        print(f"Added {len(new_fingerprints)} submissions to dedup index in {time.time() - start:.2f}s")
+        return len(new_fingerprints)
+
+    def save(self):
+        """Persist the filter bits, sorted keys and metadata"""
+        os.makedirs(self.index_dir, exist_ok=True)
+        # Each file is replaced atomically and meta.json goes last, so a crash
+        # leaves the previous watermark pointing at data that covers it
+        self.write_atomic(FILTER_FILE, lambda f: f.write(self.bloom.bits))
+        self.write_atomic(KEYS_FILE, self.keys.tofile)
+        self.write_atomic(META_FILE, lambda f: f.write(json.dumps(self.meta, indent=2).encode("utf-8")))
+
+    def write_atomic(self, filename, write):
+        path = os.path.join(self.index_dir, filename)
+        with open(path + ".tmp", "wb") as f:
+            write(f)
+        os.replace(path + ".tmp", path)
+
+    def load(self):
+        """Load a previously built index into memory"""
+        with open(os.path.join(self.index_dir, META_FILE), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        with open(os.path.join(self.index_dir, FILTER_FILE), "rb") as f:
+            bits = bytearray(f.read())
+        if self.meta.get("key_id") != self.key_id():
+            raise RuntimeError("DEDUP_HASH_KEY does not match the key the dedup index was built with")
+        self.bloom = BloomFilter(self.meta["num_bits"], self.meta["num_hashes"], bits, self.meta["count"])
+
+        self.keys = array("Q")
+        keys_path = os.path.join(self.index_dir, KEYS_FILE)
+        with open(keys_path, "rb") as f:
+            self.keys.fromfile(f, os.path.getsize(keys_path) // self.keys.itemsize)
+
+    def has_key(self, fingerprint):
+        index = bisect.bisect_left(self.keys, fingerprint)
+        return index < len(self.keys) and self.keys[index] == fingerprint
+
+    def tail_start(self):
+        """created_at from which submissions may not be in the index yet (None: all of them)"""
+        watermark_at = self.meta.get("watermark_at")
+        if not watermark_at:
+            return None
+        return datetime.fromisoformat(watermark_at) - timedelta(seconds=self.safety_lag_seconds)
+
+    def confirm(self, pairs, since=None):
+        """Check pairs against the database in one indexed query, optionally only rows created since `since`"""
+        if not pairs:
+            return set()
+        aadhaar_numbers = sorted({aadhaar for aadhaar, _ in pairs})
+        query = "SELECT aadhaar_number, pan_number FROM udyam_submissions WHERE aadhaar_number = ANY(%s)"
+        params = [aadhaar_numbers]
+        if since is not None:
+            query += " AND created_at >= %s"
+            params.append(since)
+
+        connection = self.connect()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(query, params)
+                registered = {normalize_pair(row[0], row[1]) for row in cursor.fetchall()}
+        finally:
+            connection.close()
+        return {pair for pair in pairs if pair in registered}
+
+    def check_batch(self, pairs, confirm=True):
+        """Split a batch of (aadhaar, pan) pairs into new and already registered pairs"""
+        if self.bloom is None:
+            self.load()
+
+        unique = []
+        repeated = []
+        candidates = []
+        misses = []
+        seen = set()
+        for aadhaar, pan in pairs:
+            pair = normalize_pair(aadhaar, pan)
+            # Later copies of a pair in the same batch are duplicates of the first
+            if pair in seen:
+                repeated.append(pair)
+                continue
+            seen.add(pair)
+            unique.append(pair)
+
+            digest = self.digest(*pair)
+            if digest in self.bloom and self.has_key(self.fingerprint(digest)):
+                candidates.append(pair)
+            else:
+                misses.append(pair)
+
+        if not confirm:
+            return misses, candidates + repeated
+
+        # Possible hits are confirmed against the whole table; misses only against
+        # the tail the index can't cover yet (the safety lag and anything since)
+        registered = self.confirm(candidates) | self.confirm(misses, since=self.tail_start())
+        new_pairs = [pair for pair in unique if pair not in registered]
+        duplicates = [pair for pair in unique if pair in registered] + repeated
+        return new_pairs, duplicates
+
+def read_batch(path):
+    """Read aadhaar_number/pan_number columns from a CSV file"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return [(row.get("aadhaar_number", ""), row.get("pan_number", "")) for row in csv.DictReader(f)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Duplicate Aadhaar/PAN registration index for bulk imports")
+    parser.add_argument("command", choices=["build", "update", "check"])
+    parser.add_argument("batch", nargs="?", help="CSV file with aadhaar_number and pan_number columns (check only)")
+    parser.add_argument("--index-dir", default="data/dedup-index")
+    parser.add_argument("--capacity", type=int, help="Expected number of registrations (build only)")
+    args = parser.parse_args()
+
+    index = RegistrationDedupIndex(
+        index_dir=args.index_dir,
+        safety_lag_seconds=float(os.environ.get("DEDUP_SAFETY_LAG_SECONDS", "300")),
+    )
+
+    if args.command == "build":
+        index.build(capacity=args.capacity)
+    elif args.command == "update":
+        index.update()
+    else:
+        if not args.batch:
+            parser.error("check requires a batch CSV file")
+        new_pairs, duplicates = index.check_batch(read_batch(args.batch))
+        print(f"New registrations: {len(new_pairs)}")
+        print(f"Already registered: {len(duplicates)}")
+        for aadhaar, pan in duplicates:
+            print(f"  - {aadhaar[:4]}XXXXXXXX {pan}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import argparse
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Minimal page with the inputs UdyamFormScraper looks for
+FORM_PAGE = b"""<html><body>
+<form id="form1">
+  <label for="txtadharno">1. Aadhaar Number/ \xe0\xa4\x86\xe0\xa4\xa7\xe0\xa4\xbe\xe0\xa4\xb0 \xe0\xa4\xb8\xe0\xa4\x82\xe0\xa4\x96\xe0\xa5\x8d\xe0\xa4\xaf\xe0\xa4\xbe</label>
+  <input type="text" id="txtadharno" name="txtadharno" maxlength="12" required>
+  <label for="txtPan">PAN</label>
+  <input type="text" id="txtPan" name="txtPan" maxlength="10">
+  <input type="button" id="btnValidateAadhaar" value="Validate &amp; Generate OTP">
+</form>
+</body></html>"""
+
+# A 200 response without the form, as served while the portal is down for maintenance
+MAINTENANCE_PAGE = b"<html><body><h1>Under maintenance</h1><p>Please try again later.</p></body></html>"
+# The same notice inside the ASP.NET page form, without any of the form's inputs
+MAINTENANCE_FORM_PAGE = b"""<html><body>
+<form id="form1"><h1>Site under maintenance</h1><p>Please try again later.</p></form>
+</body></html>"""
+
+MODES = ["ok", "error", "slow", "hang", "reset", "flaky", "recover", "maintenance", "maintenance-form"]
+
+class FaultInjectingHandler(BaseHTTPRequestHandler):
+    mode = "ok"
+    delay = 20.0
+    failure_rate = 0.5
+    failures = 2
+    request_count = 0
+
+    def do_GET(self):
+        type(self).request_count += 1
+        mode = self.mode
+        if mode == "flaky":
+            mode = "error" if random.random() < self.failure_rate else "ok"
+        elif mode == "recover":
+            # Deterministic flakiness: the first `failures` requests fail
+            mode = "error" if self.request_count <= self.failures else "ok"
+
+        if mode in ("maintenance", "maintenance-form"):
+            page = MAINTENANCE_PAGE if mode == "maintenance" else MAINTENANCE_FORM_PAGE
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+            return
+
+        if mode == "error":
+            self.send_response(503)
+            self.end_headers()
+            return
+        if mode == "reset":
+            # Drop the connection without a response
+            self.close_connection = True
+            self.connection.close()
+            return
+        if mode == "hang":
+            time.sleep(self.delay)
+            return
+        if mode == "slow":
+            # Headers arrive, the body stalls past the read timeout
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.end_headers()
+            time.sleep(self.delay)
+
+        if mode == "ok":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(FORM_PAGE)))
+            self.end_headers()
+        self.wfile.write(FORM_PAGE)
+
+    def log_message(self, format, *args):
+        print(f"[{self.mode}] {self.address_string()} {format % args}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Udyam portal stand-in that injects faults")
+    parser.add_argument("--mode", choices=MODES, default="ok")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=20.0, help="Seconds to stall in slow/hang modes")
+    parser.add_argument("--failure-rate", type=float, default=0.5, help="Share of failed requests in flaky mode")
+    parser.add_argument("--failures", type=int, default=2, help="Requests that fail before recover mode succeeds")
+    args = parser.parse_args()
+
+    FaultInjectingHandler.mode = args.mode
+    FaultInjectingHandler.delay = args.delay
+    FaultInjectingHandler.failure_rate = args.failure_rate
+    FaultInjectingHandler.failures = args.failures
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), FaultInjectingHandler)
+    print(f"Serving {args.mode} responses on http://127.0.0.1:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,34 @@
-import requests
-from bs4 import BeautifulSoup
 import json
 import re
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+# selenium and BeautifulSoup are imported where they are used so that
+# serving scrape_with_fallback() doesn't pay their import cost
+
+# Portal URL per language; the browser's Accept-Language is set to match as well
+LANGUAGE_URLS = {
+    "en": "https://udyamregistration.gov.in/UdyamRegistration.aspx",
+    "hi": "https://udyamregistration.gov.in/UdyamRegistration.aspx?lang=hi",
+}
+# Language of the built-in scrape_with_fallback() text
+FALLBACK_LANGUAGE = "en"
+DEVANAGARI = re.compile(r"[\u0900-\u097F]")
+LATIN = re.compile(r"[A-Za-z]")
+NUMBER_PREFIX = re.compile(r"^\s*(\d+\.)\s*")
+
+# Per-language text attributes of fields and UI components
+FIELD_TEXT_ATTRS = ["label", "placeholder", "validation_message", "description"]
+COMPONENT_TEXT_ATTRS = ["text", "label"]
 
 class UdyamScraper:
-    def __init__(self):
-        self.base_url = "https://udyamregistration.gov.in/UdyamRegistration.aspx"
+    def __init__(self, language="en", base_url=None):
+        self.language = language
+        self.base_url = base_url or LANGUAGE_URLS.get(language, LANGUAGE_URLS["en"])
+        # "live" or "fallback", set by run_scraping()
+        self.source = None
+        # Languages whose run_bilingual() variant came from fallback data
+        self.fallback_languages = []
         self.scraped_data = {
             "step1": {
                 "title": "",
@@ -31,11 +48,20 @@ class UdyamScraper:
         
     def setup_driver(self):
         """Setup Chrome driver with appropriate options"""
+        try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+        except ImportError as e:
+            print(f"Selenium is not available: {e}")
+            return None
+
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        chrome_options.add_argument(f"--lang={self.language}")
+        chrome_options.add_experimental_option("prefs", {"intl.accept_languages": self.language})
         
         try:
             driver = webdriver.Chrome(options=chrome_options)
@@ -113,6 +139,11 @@ class UdyamScraper:
     def scrape_step1_aadhaar_otp(self, driver):
         """Scrape Step 1: Aadhaar + OTP Validation"""
         try:
+            from bs4 import BeautifulSoup
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
+
             driver.get(self.base_url)
             time.sleep(3)
             
@@ -183,6 +214,7 @@ class UdyamScraper:
         try:
             # This would typically involve clicking "Next" or similar
             # For now, we'll extract PAN-related elements from the same page
+            from bs4 import BeautifulSoup
             
             soup = BeautifulSoup(driver.page_source, 'html.parser')
             
@@ -328,6 +360,7 @@ class UdyamScraper:
         driver = self.setup_driver()
         if not driver:
             print("Using fallback data due to driver setup failure")
+            self.source = "fallback"
             return self.scrape_with_fallback()
         
         try:
@@ -337,28 +370,205 @@ class UdyamScraper:
             # Scrape Step 2: PAN Validation
             self.scrape_step2_pan_validation(driver)
             
+            self.source = "live"
             return self.scraped_data
             
         except Exception as e:
             print(f"Scraping failed: {e}")
             print("Using fallback data...")
+            self.source = "fallback"
             return self.scrape_with_fallback()
             
         finally:
             if driver:
                 driver.quit()
     
-    def save_results(self, data):
+    def run_bilingual(self, languages=("en", "hi")):
+        """Scrape each language variant concurrently and merge them by field id/name"""
+        print(f"Starting concurrent scraping for languages: {', '.join(languages)}")
+        start = time.time()
+
+        # One scraper (and browser) per language, since each fills its own scraped_data
+        scrapers = {lang: UdyamScraper(language=lang) for lang in languages}
+        with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+            futures = {lang: executor.submit(scraper.run_scraping) for lang, scraper in scrapers.items()}
+            variants = {lang: future.result() for lang, future in futures.items()}
+
+        print(f"Scraped {len(variants)} language variants in {time.time() - start:.2f}s")
+        self.fallback_languages = [lang for lang, scraper in scrapers.items() if scraper.source != "live"]
+        for lang in self.fallback_languages:
+            if lang == FALLBACK_LANGUAGE:
+                print(f"Warning: '{lang}' was not scraped live; using built-in fallback text")
+            else:
+                print(f"Warning: '{lang}' was not scraped live; only its text found in bilingual fallback labels is kept")
+        return merge_language_variants(variants, primary=languages[0], fallback_languages=self.fallback_languages)
+
+    def save_results(self, data, filename="public/udyam-scraped-data.json"):
         """Save scraped data to JSON file"""
-        with open("public/udyam-scraped-data.json", "w", encoding="utf-8") as f:
+        with open(filename, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
         
-        print("Scraped data saved to public/udyam-scraped-data.json")
+        print(f"Scraped data saved to {filename}")
 
-if __name__ == "__main__":
+def split_bilingual_text(text):
+    """Split portal labels such as "1. Aadhaar Number/ आधार संख्या" into per-language parts
+
+    Only the "/" between the Latin and the Devanagari run separates languages;
+    slashes inside either part ("DD/MM/YYYY", "उद्यम/व्यवसाय") stay in that part.
+    """
+    if not isinstance(text, str) or "/" not in text or not DEVANAGARI.search(text):
+        return {}
+
+    prefix_match = NUMBER_PREFIX.match(text)
+    prefix = f"{prefix_match.group(1)} " if prefix_match else ""
+    body = text[prefix_match.end():] if prefix_match else text
+
+    # Slashes inside brackets, as in "(DD/MM/YYYY)", never separate languages
+    slashes = []
+    depth = 0
+    for position, char in enumerate(body):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth = max(depth - 1, 0)
+        elif char == "/" and depth == 0:
+            slashes.append(position)
+
+    hindi = [match.start() for match in DEVANAGARI.finditer(body)]
+    # English first: the last "/" before the Hindi run; Hindi first: the first one after it
+    before = [position for position in slashes if position < hindi[0] and LATIN.search(body[:position])]
+    after = [position for position in slashes if position > hindi[-1] and LATIN.search(body[position + 1:])]
+    if before:
+        english, other = body[:before[-1]], body[before[-1] + 1:]
+    elif after:
+        other, english = body[:after[0]], body[after[0] + 1:]
+    else:
+        return {}
+
+    parts = {"en": english.strip(), "hi": other.strip()}
+    if not all(parts.values()):
+        return {}
+    return {lang: prefix + part for lang, part in parts.items()}
+
+def merge_text(values, borrowed=()):
+    """Merge one attribute across language variants into a {language: text} dict
+
+    Variants in `borrowed` hold fallback text in another language, so only the
+    parts split out of combined labels are used from them.
+    """
+    merged = {}
+    derived = {}
+    for lang, text in values.items():
+        parts = split_bilingual_text(text)
+        if lang in borrowed:
+            for part_lang, part in parts.items():
+                derived.setdefault(part_lang, part)
+        elif parts:
+            merged[lang] = parts.get(lang, text)
+            for part_lang, part in parts.items():
+                derived.setdefault(part_lang, part)
+        elif text:
+            merged[lang] = text
+
+    # Text from a combined label only fills languages that had nothing of their own
+    for lang, text in derived.items():
+        merged.setdefault(lang, text)
+    return merged
+
+def align_items(variants, primary, text_attrs, borrowed=()):
+    """Align fields or UI components across languages by id, then name"""
+    merged = []
+    index = {}
+
+    for lang in [primary] + [l for l in variants if l != primary]:
+        for item in variants[lang]:
+            keys = [k for k in (item.get("id"), item.get("name")) if k]
+            position = next((index[k] for k in keys if k in index), None)
+
+            if position is None:
+                # The primary language decides structural attributes
+                entry = {k: v for k, v in item.items() if k not in text_attrs}
+                entry["key"] = keys[0] if keys else f"item_{len(merged)}"
+                entry["_texts"] = {attr: {} for attr in text_attrs}
+                merged.append(entry)
+                position = len(merged) - 1
+
+            for k in keys:
+                index.setdefault(k, position)
+            for attr in text_attrs:
+                if item.get(attr):
+                    merged[position]["_texts"][attr].setdefault(lang, item[attr])
+
+    for entry in merged:
+        texts = entry.pop("_texts")
+        for attr in text_attrs:
+            entry[attr] = merge_text(texts[attr], borrowed)
+    return merged
+
+def merge_language_variants(variants, primary="en", fallback_languages=()):
+    """Combine per-language scrape results into one structure with per-language text"""
+    # Fallback data is written in FALLBACK_LANGUAGE and must not pass as another language's text
+    borrowed = {lang for lang in fallback_languages if lang != FALLBACK_LANGUAGE}
+    merged = {}
+    step_names = list(variants[primary].keys())
+    for lang_data in variants.values():
+        step_names += [name for name in lang_data if name not in step_names]
+
+    for step_name in step_names:
+        steps = {lang: data[step_name] for lang, data in variants.items() if step_name in data}
+        base = steps.get(primary) or next(iter(steps.values()))
+
+        merged[step_name] = {
+            "title": merge_text({lang: step.get("title", "") for lang, step in steps.items()}, borrowed),
+            "fields": align_items({lang: step.get("fields", []) for lang, step in steps.items()}, primary, FIELD_TEXT_ATTRS, borrowed),
+            "validation_rules": base.get("validation_rules", {}),
+            "ui_components": align_items({lang: step.get("ui_components", []) for lang, step in steps.items()}, primary, COMPONENT_TEXT_ATTRS, borrowed),
+            "instructions": {lang: step.get("instructions", []) for lang, step in steps.items() if lang not in borrowed},
+        }
+
+    return merged
+
+def to_camel_case(value):
+    parts = [p for p in re.split(r"[^0-9A-Za-z]+", value) if p]
+    return parts[0].lower() + "".join(p.capitalize() for p in parts[1:]) if parts else value
+
+def build_i18n_table(merged):
+    """Build a lib/i18n.ts style {language: {key: text}} table from a merged scrape"""
+    table = {}
+    suffixes = {"label": "Label", "placeholder": "Placeholder", "validation_message": "Message", "text": "Text"}
+
+    def add(lang, key, text):
+        if text:
+            table.setdefault(lang, {})[key] = text
+
+    for step_name, step in merged.items():
+        for lang, text in step["title"].items():
+            add(lang, f"{step_name}Title", text)
+        for lang, instructions in step["instructions"].items():
+            add(lang, f"{step_name}Instructions", instructions)
+
+        for item in step["fields"] + step["ui_components"]:
+            name = to_camel_case(item.get("name") or item["key"])
+            for attr, suffix in suffixes.items():
+                for lang, text in item.get(attr, {}).items():
+                    add(lang, f"{name}{suffix}", text)
+
+    return table
+
+def main(output="public/udyam-scraped-data.json", bilingual=False, i18n_output=None):
     scraper = UdyamScraper()
+    if bilingual:
+        merged = scraper.run_bilingual()
+        scraper.save_results(merged, output)
+        if i18n_output:
+            scraper.save_results(build_i18n_table(merged), i18n_output)
+            if scraper.fallback_languages:
+                print(f"Warning: {i18n_output} is incomplete for: {', '.join(scraper.fallback_languages)}")
+        print(f"Merged {sum(len(step['fields']) for step in merged.values())} fields across languages")
+        return
+
     scraped_data = scraper.run_scraping()
-    scraper.save_results(scraped_data)
+    scraper.save_results(scraped_data, output)
     
     # Print summary
     print("\n=== SCRAPING SUMMARY ===")
@@ -368,3 +578,6 @@ if __name__ == "__main__":
     print(f"Step 2 Fields: {len(scraped_data['step2']['fields'])}")
     print(f"Step 2 UI Components: {len(scraped_data['step2']['ui_components'])}")
     print(f"Step 2 Instructions: {len(scraped_data['step2']['instructions'])}")
+
+if __name__ == "__main__":
+    main()
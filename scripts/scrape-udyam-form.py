@@ -1,25 +1,238 @@
-import requests
-from bs4 import BeautifulSoup
 import json
 import re
 from urllib.parse import urljoin
 import time
+import gzip
+import hashlib
+import os
+import random
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+# Fields extract_step1_fields/extract_step2_fields add whether or not the page has them
+STATIC_FIELD_IDS = {"otp", "applicant_name"}
+
+class FetchError(Exception):
+    def __init__(self, message, attempts):
+        super().__init__(message)
+        self.attempts = attempts
+
+class CircuitBreaker:
+    """Circuit breaker whose state survives between scraper runs"""
+
+    def __init__(self, path, failure_threshold=3, reset_timeout=300):
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = {"status": "closed", "failures": 0, "opened_at": None}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.state.update(json.load(f))
+        except (FileNotFoundError, ValueError):
+            pass
+
+    @property
+    def status(self):
+        if self.state["status"] == "open" and time.time() - self.state["opened_at"] >= self.reset_timeout:
+            return "half_open"
+        return self.state["status"]
+
+    def allow_request(self):
+        """Closed or half-open circuits let a request through; open ones short-circuit"""
+        return self.status != "open"
+
+    def record_success(self):
+        self.state = {"status": "closed", "failures": 0, "opened_at": None}
+        self.save()
+
+    def record_failure(self):
+        self.state["failures"] += 1
+        # A failed half-open trial reopens the circuit immediately
+        if self.status == "half_open" or self.state["failures"] >= self.failure_threshold:
+            self.state["status"] = "open"
+            self.state["opened_at"] = time.time()
+        self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(self.path + ".tmp", self.path)
+
+class FetchMetrics:
+    """Append-only JSON lines log of fetch outcomes and latency"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def record(self, outcome, latency, attempts, reason="", circuit="closed"):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        entry = {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "outcome": outcome,
+            "latency_ms": round(latency * 1000, 1),
+            "attempts": attempts,
+            "reason": reason,
+            "circuit": circuit,
+        }
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def summary(self):
+        """Fallback frequency and latency percentiles over the recorded runs"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            entries = []
+
+        if not entries:
+            return {"runs": 0}
+
+        outcomes = {}
+        for entry in entries:
+            outcomes[entry["outcome"]] = outcomes.get(entry["outcome"], 0) + 1
+        latencies = sorted(entry["latency_ms"] for entry in entries)
+
+        def percentile(p):
+            return latencies[min(len(latencies) - 1, int(round(p * (len(latencies) - 1))))]
+
+        return {
+            "runs": len(entries),
+            "outcomes": outcomes,
+            "fallback_rate": round(1 - outcomes.get("live", 0) / len(entries), 3),
+            "latency_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "max": latencies[-1]},
+        }
+
+class ResilientFetcher:
+    """Pooled HTTP fetches with split timeouts and jittered exponential backoff"""
+
+    def __init__(self, connect_timeout=3, read_timeout=10, total_timeout=20, max_attempts=3,
+                 backoff_base=0.5, backoff_max=8, pool_connections=4, pool_maxsize=8):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        # Budget for all attempts and backoff together; it caps each connect and
+        # read wait, but a body that keeps trickling in can still run past it
+        self.total_timeout = total_timeout
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._session = None
+
+    @property
+    def session(self):
+        """HTTP session, created on first use so publishing doesn't import requests"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            self._session = requests.Session()
+            # Retries are handled in get() so they share the backoff and breaker accounting
+            adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, max_retries=0)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            self._session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            })
+        return self._session
+
+    def backoff(self, attempt):
+        """Full-jitter exponential backoff delay before the given retry"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def get(self, url):
+        """GET a URL, retrying connection errors, timeouts and retryable statuses"""
+        import requests
+
+        deadline = time.time() + self.total_timeout
+        last_error = None
+        for attempt in range(1, self.max_attempts + 1):
+            remaining = max(deadline - time.time(), 0.1)
+            timeout = (min(self.connect_timeout, remaining), min(self.read_timeout, remaining))
+            try:
+                response = self.session.get(url, timeout=timeout)
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    return response, attempt
+                last_error = f"HTTP {response.status_code}"
+            except (requests.ConnectionError, requests.Timeout) as e:
+                last_error = f"{type(e).__name__}: {e}"
+            except requests.HTTPError as e:
+                # Other 4xx responses won't improve on retry
+                raise FetchError(str(e), attempt)
+
+            delay = self.backoff(attempt - 1)
+            if attempt == self.max_attempts or time.time() + delay >= deadline:
+                raise FetchError(last_error, attempt)
+            print(f"Fetch attempt {attempt} failed ({last_error}), retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+        raise FetchError(last_error, self.max_attempts)
 
 class UdyamFormScraper:
-    def __init__(self):
+    def __init__(self, form_url=None, state_dir="data/scraper", fetcher=None):
         self.base_url = "https://udyamregistration.gov.in"
-        self.form_url = "https://udyamregistration.gov.in/UdyamRegistration.aspx"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.form_url = form_url or "https://udyamregistration.gov.in/UdyamRegistration.aspx"
+        self.state_dir = state_dir
+        self.fetcher = fetcher or ResilientFetcher()
+        self.breaker = CircuitBreaker(os.path.join(state_dir, "circuit.json"))
+        self.metrics = FetchMetrics(os.path.join(state_dir, "fetch-metrics.jsonl"))
+        self.last_good_path = os.path.join(state_dir, "last-good-structure.json")
+        # "live", "fallback_cache" or "fallback_static" for the last scrape
+        self.last_outcome = None
+
+    @property
+    def session(self):
+        return self.fetcher.session
+
+    def load_last_good(self):
+        """Last structure scraped live from the portal, if any"""
+        try:
+            with open(self.last_good_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def save_last_good(self, data):
+        os.makedirs(self.state_dir, exist_ok=True)
+        with open(self.last_good_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(self.last_good_path + ".tmp", self.last_good_path)
+
+    def fallback(self, reason, started, attempts):
+        """Serve the cached last-good structure, or the built-in one, and record why"""
+        data = self.load_last_good()
+        outcome = "fallback_cache"
+        if data is None:
+            data = self.get_fallback_structure()
+            outcome = "fallback_static"
+        else:
+            # Kept stable so republishing an unchanged cache keeps its content hash
+            data.setdefault("metadata", {})["note"] = "Cached structure used"
+
+        self.last_outcome = outcome
+        self.metrics.record(outcome, time.time() - started, attempts, reason, self.breaker.status)
+        return data
         
     def scrape_form_structure(self):
         """Scrape the Udyam registration form structure"""
+        started = time.time()
+
+        if not self.breaker.allow_request():
+            print("Portal circuit is open, using last good structure")
+            return self.fallback("circuit open", started, 0)
+
         try:
             print("Fetching Udyam registration form...")
-            response = self.session.get(self.form_url, timeout=30)
-            response.raise_for_status()
+            response, attempts = self.fetcher.get(self.form_url)
+        except FetchError as e:
+            self.breaker.record_failure()
+            print(f"Error fetching form after {e.attempts} attempts: {e}")
+            return self.fallback(str(e), started, e.attempts)
+
+        try:
+            from bs4 import BeautifulSoup
             
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -54,12 +267,34 @@ class UdyamFormScraper:
                 # Extract UI components
                 form_data["ui_components"] = self.extract_ui_components(soup)
             
-            return form_data
-            
         except Exception as e:
             print(f"Error scraping form: {str(e)}")
-            return self.get_fallback_structure()
+            self.breaker.record_failure()
+            return self.fallback(f"parse error: {e}", started, attempts)
+
+        # A 200 without the Aadhaar and PAN inputs (e.g. a maintenance page, even
+        # one inside <form>) is a degraded portal too
+        if not self.has_scraped_inputs(form_data):
+            print("Aadhaar/PAN inputs not found in the portal response")
+            self.breaker.record_failure()
+            return self.fallback("form inputs missing", started, attempts)
+
+        self.breaker.record_success()
+        self.save_last_good(form_data)
+        self.last_outcome = "live"
+        self.metrics.record("live", time.time() - started, attempts)
+        return form_data
     
+    @staticmethod
+    def has_scraped_inputs(form_data):
+        """Whether both steps contain inputs found on the page, not just the static ones"""
+        scraped_steps = {
+            step["step_number"]
+            for step in form_data["steps"]
+            if any(field["id"] not in STATIC_FIELD_IDS for field in step["fields"])
+        }
+        return {1, 2} <= scraped_steps
+
     def extract_step1_fields(self, soup):
         """Extract Aadhaar and OTP validation fields"""
         step1 = {
@@ -78,7 +313,7 @@ class UdyamFormScraper:
             
             # Check if this looks like an Aadhaar field
             if any(keyword in field_id.lower() or keyword in field_name.lower() 
-                   for keyword in ['aadhaar', 'aadhar', 'uid']):
+                   for keyword in ['aadhaar', 'adhar', 'uid']):
                 
                 label = self.find_label_for_input(soup, input_field)
                 
@@ -349,14 +584,113 @@ class UdyamFormScraper:
             json.dump(data, f, indent=2, ensure_ascii=False)
         print(f"Form structure saved to {filename}")
 
-def main():
-    scraper = UdyamFormScraper()
+    def publish_json(self, data, output_dir="public", name="udyam-form-structure", keep=3):
+        """Publish compact, precompressed and content-hashed copies of the form structure"""
+        # scraped_at changes on every run, so it is kept out of the hash; an
+        # unchanged structure keeps its URL and stays cached by clients
+        hashed_data = dict(data)
+        hashed_data["metadata"] = {k: v for k, v in data.get("metadata", {}).items() if k != "scraped_at"}
+        canonical = json.dumps(hashed_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        content_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+        filename = f"{name}.{content_hash}.json"
+        path = os.path.join(output_dir, filename)
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Files are immutable once published under a hash; an intact copy is
+        # kept as is and only missing or damaged variants are (re)written
+        payload = self.read_published(path, lambda raw: raw, validate=json.loads)
+        if payload is None:
+            payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            self.write_atomic(path, payload)
+
+        if self.read_published(path + ".gz", gzip.decompress) != payload:
+            self.write_atomic(path + ".gz", gzip.compress(payload, compresslevel=9, mtime=0))
+
+        try:
+            import brotli
+            if self.read_published(path + ".br", brotli.decompress) != payload:
+                self.write_atomic(path + ".br", brotli.compress(payload, quality=11))
+        except ImportError:
+            print("brotli not installed, skipping .br variant")
+
+        # Mark this version as the newest one for pruning
+        os.utime(path)
+
+        variants = {"identity": filename}
+        sizes = {"identity": os.path.getsize(path)}
+        for encoding, suffix in (("gzip", ".gz"), ("br", ".br")):
+            if os.path.exists(path + suffix):
+                variants[encoding] = filename + suffix
+                sizes[encoding] = os.path.getsize(path + suffix)
+
+        manifest = {
+            "name": name,
+            "hash": content_hash,
+            "file": filename,
+            "variants": variants,
+            "sizes": sizes,
+            "scraped_at": data.get("metadata", {}).get("scraped_at"),
+            "published_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        manifest_path = os.path.join(output_dir, f"{name}.manifest.json")
+        with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(manifest_path + ".tmp", manifest_path)
+
+        self.prune_published(output_dir, name, keep)
+        print(f"Published {filename} ({', '.join(f'{k}: {v} bytes' for k, v in sizes.items())})")
+        return manifest
+
+    @staticmethod
+    def write_atomic(path, payload):
+        with open(path + ".tmp", "wb") as f:
+            f.write(payload)
+        os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def read_published(path, decode, validate=None):
+        """Decoded contents of a published file, or None if it is missing or damaged"""
+        try:
+            with open(path, "rb") as f:
+                content = decode(f.read())
+            if validate:
+                validate(content)
+            return content
+        except Exception:
+            return None
+
+    @staticmethod
+    def prune_published(output_dir, name, keep):
+        """Delete all but the newest `keep` hashed versions and their variants"""
+        pattern = re.compile(rf"^{re.escape(name)}\.[0-9a-f]{{16}}\.json$")
+        versions = sorted(
+            (entry for entry in os.listdir(output_dir) if pattern.match(entry)),
+            key=lambda entry: os.path.getmtime(os.path.join(output_dir, entry)),
+            reverse=True,
+        )
+        for stale in versions[keep:]:
+            for suffix in ("", ".gz", ".br"):
+                try:
+                    os.remove(os.path.join(output_dir, stale + suffix))
+                except FileNotFoundError:
+                    pass
+            print(f"Pruned old form structure {stale}")
+
+def main(output="public/udyam-form-structure.json", publish_dir="public", form_url=None, state_dir="data/scraper"):
+    scraper = UdyamFormScraper(form_url=form_url, state_dir=state_dir)
     
     print("Starting Udyam form scraping...")
     form_data = scraper.scrape_form_structure()
     
-    # Save to JSON file
-    scraper.save_to_json(form_data, "public/udyam-form-structure.json")
+    # The cached structure is what was last published, so leave it in place
+    if scraper.last_outcome == "fallback_cache" and os.path.exists(output):
+        print(f"Portal unavailable, keeping {output}")
+    else:
+        # Save to JSON file
+        scraper.save_to_json(form_data, output)
+        if publish_dir:
+            scraper.publish_json(form_data, publish_dir)
     
     print("\nScraping completed!")
     print(f"Found {len(form_data['steps'])} steps")
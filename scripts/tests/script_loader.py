@@ -0,0 +1,15 @@
+import importlib.util
+import os
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_script(filename):
+    """Import a hyphenated sibling script as a module"""
+    module_name = filename[:-3].replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(SCRIPTS_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def has_module(name):
+    return importlib.util.find_spec(name) is not None
@@ -0,0 +1,59 @@
+import unittest
+
+from script_loader import load_script
+
+aggregate = load_script("aggregate-submissions.py")
+
+def change(submission_id, state, district, status, business_type, previous=None):
+    """A fetch_changes() row: id, updated_at, current dimensions, seen flag, previous dimensions"""
+    seen = previous is not None
+    return (submission_id, "2025-01-08T12:00:00", state, district, status, business_type, seen, *(previous or (None,) * 4))
+
+class ComputeDeltasTest(unittest.TestCase):
+    def setUp(self):
+        self.aggregator = aggregate.SubmissionAggregator(database_url="postgresql://unused")
+
+    def test_new_rows_count_towards_total_and_each_dimension(self):
+        deltas = self.aggregator.compute_deltas([
+            change("a", "Kerala", "Ernakulam", "submitted", "Proprietorship"),
+            change("b", "Kerala", None, "submitted", None),
+        ])
+
+        self.assertEqual(deltas, {
+            ("total", "all"): 2,
+            ("state", "Kerala"): 2,
+            ("district", "Ernakulam"): 1,
+            ("district", "unknown"): 1,
+            ("submission_status", "submitted"): 2,
+            ("business_type", "Proprietorship"): 1,
+            ("business_type", "unknown"): 1,
+        })
+
+    def test_changed_dimension_moves_count_between_buckets(self):
+        deltas = self.aggregator.compute_deltas([
+            change("a", "Kerala", "Ernakulam", "approved", "Proprietorship",
+                   previous=("Kerala", "Ernakulam", "submitted", "Proprietorship")),
+        ])
+
+        self.assertEqual(deltas, {
+            ("submission_status", "submitted"): -1,
+            ("submission_status", "approved"): 1,
+        })
+
+    def test_unchanged_row_produces_no_deltas(self):
+        deltas = self.aggregator.compute_deltas([
+            change("a", "Kerala", None, "submitted", None, previous=("Kerala", None, "submitted", None)),
+        ])
+
+        self.assertEqual(deltas, {})
+
+    def test_opposite_moves_in_one_batch_cancel_out(self):
+        deltas = self.aggregator.compute_deltas([
+            change("a", "Goa", "North Goa", "submitted", None, previous=("Kerala", "North Goa", "submitted", None)),
+            change("b", "Kerala", "North Goa", "submitted", None, previous=("Goa", "North Goa", "submitted", None)),
+        ])
+
+        self.assertEqual(deltas, {})
+
+if __name__ == "__main__":
+    unittest.main()
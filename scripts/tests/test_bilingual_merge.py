@@ -0,0 +1,134 @@
+import unittest
+
+from script_loader import load_script
+
+detailed = load_script("scrape-udyam-detailed.py")
+
+class SplitBilingualTextTest(unittest.TestCase):
+    def test_splits_english_and_hindi_keeping_number_prefix(self):
+        self.assertEqual(
+            detailed.split_bilingual_text("1. Aadhaar Number/ आधार संख्या"),
+            {"en": "1. Aadhaar Number", "hi": "1. आधार संख्या"},
+        )
+
+    def test_slashes_inside_a_language_stay_in_that_part(self):
+        self.assertEqual(
+            detailed.split_bilingual_text("Date of Birth (DD/MM/YYYY)/ जन्म तिथि"),
+            {"en": "Date of Birth (DD/MM/YYYY)", "hi": "जन्म तिथि"},
+        )
+        self.assertEqual(
+            detailed.split_bilingual_text("Enterprise/Business Name / उद्यम/व्यवसाय का नाम"),
+            {"en": "Enterprise/Business Name", "hi": "उद्यम/व्यवसाय का नाम"},
+        )
+
+    def test_hindi_first_labels(self):
+        self.assertEqual(
+            detailed.split_bilingual_text("जन्म तिथि (DD/MM/YYYY) / Date of Birth (DD/MM/YYYY)"),
+            {"en": "Date of Birth (DD/MM/YYYY)", "hi": "जन्म तिथि (DD/MM/YYYY)"},
+        )
+
+    def test_single_language_text_is_not_split(self):
+        self.assertEqual(detailed.split_bilingual_text("Enterprise/Business Name"), {})
+        self.assertEqual(detailed.split_bilingual_text("जन्म तिथि (DD/MM/YYYY)"), {})
+        self.assertEqual(detailed.split_bilingual_text(None), {})
+
+class MergeTextTest(unittest.TestCase):
+    def test_own_text_wins_over_parts_of_combined_labels(self):
+        merged = detailed.merge_text({"en": "Aadhaar Number/ आधार संख्या", "hi": "आधार नंबर"})
+
+        self.assertEqual(merged, {"en": "Aadhaar Number", "hi": "आधार नंबर"})
+
+    def test_combined_label_fills_missing_language(self):
+        merged = detailed.merge_text({"en": "Date of Birth (DD/MM/YYYY)/ जन्म तिथि", "hi": ""})
+
+        self.assertEqual(merged, {"en": "Date of Birth (DD/MM/YYYY)", "hi": "जन्म तिथि"})
+
+    def test_borrowed_text_is_not_kept_as_its_own_language(self):
+        merged = detailed.merge_text({"en": "Name is required", "hi": "Name is required"}, borrowed={"hi"})
+
+        self.assertEqual(merged, {"en": "Name is required"})
+
+class AlignItemsTest(unittest.TestCase):
+    def test_items_are_matched_by_id_then_name(self):
+        variants = {
+            "en": [
+                {"id": "aadhaar", "name": "aadhaar", "type": "text", "label": "Aadhaar Number"},
+                {"name": "pan", "type": "text", "label": "PAN"},
+            ],
+            "hi": [
+                {"id": "pan_hi", "name": "pan", "type": "ignored", "label": "पैन"},
+                {"id": "aadhaar", "type": "text", "label": "आधार संख्या"},
+                {"id": "extra", "label": "अतिरिक्त"},
+            ],
+        }
+
+        merged = detailed.align_items(variants, "en", ["label"])
+
+        self.assertEqual([item["key"] for item in merged], ["aadhaar", "pan", "extra"])
+        self.assertEqual(merged[0]["label"], {"en": "Aadhaar Number", "hi": "आधार संख्या"})
+        self.assertEqual(merged[1]["label"], {"en": "PAN", "hi": "पैन"})
+        self.assertEqual(merged[1]["type"], "text")
+        self.assertEqual(merged[2]["label"], {"hi": "अतिरिक्त"})
+
+def step(title, label, message, instructions):
+    return {
+        "title": title,
+        "fields": [{"id": "dob", "name": "dob", "type": "date", "label": label, "validation_message": message}],
+        "validation_rules": {"dob": {"required": True}},
+        "ui_components": [{"id": "next_btn", "type": "button", "text": "Next"}],
+        "instructions": instructions,
+    }
+
+class MergeLanguageVariantsTest(unittest.TestCase):
+    def test_live_variants_merge_per_language(self):
+        variants = {
+            "en": {"step1": step("Step 1", "Date of Birth (DD/MM/YYYY)/ जन्म तिथि", "Required", ["Use DD/MM/YYYY"])},
+            "hi": {"step1": step("चरण 1", "जन्म तिथि", "आवश्यक", ["DD/MM/YYYY लिखें"])},
+        }
+
+        merged = detailed.merge_language_variants(variants)
+
+        field = merged["step1"]["fields"][0]
+        self.assertEqual(merged["step1"]["title"], {"en": "Step 1", "hi": "चरण 1"})
+        self.assertEqual(field["label"], {"en": "Date of Birth (DD/MM/YYYY)", "hi": "जन्म तिथि"})
+        self.assertEqual(field["validation_message"], {"en": "Required", "hi": "आवश्यक"})
+        self.assertEqual(set(merged["step1"]["instructions"]), {"en", "hi"})
+
+    def test_fallback_language_keeps_only_hindi_parts_of_combined_labels(self):
+        english = step("Step 1", "Date of Birth (DD/MM/YYYY)/ जन्म तिथि", "Required", ["Use DD/MM/YYYY"])
+        variants = {"en": {"step1": english}, "hi": {"step1": dict(english)}}
+
+        merged = detailed.merge_language_variants(variants, fallback_languages=["hi"])
+
+        field = merged["step1"]["fields"][0]
+        self.assertEqual(field["label"], {"en": "Date of Birth (DD/MM/YYYY)", "hi": "जन्म तिथि"})
+        self.assertEqual(field["validation_message"], {"en": "Required"})
+        self.assertEqual(merged["step1"]["title"], {"en": "Step 1"})
+        self.assertEqual(list(merged["step1"]["instructions"]), ["en"])
+
+    def test_fallback_english_is_still_english(self):
+        english = step("Step 1", "Date of Birth", "Required", [])
+        variants = {"en": {"step1": english}, "hi": {"step1": step("चरण 1", "जन्म तिथि", "आवश्यक", [])}}
+
+        merged = detailed.merge_language_variants(variants, fallback_languages=["en"])
+
+        self.assertEqual(merged["step1"]["fields"][0]["label"], {"en": "Date of Birth", "hi": "जन्म तिथि"})
+
+class BuildI18nTableTest(unittest.TestCase):
+    def test_table_is_keyed_per_language(self):
+        variants = {
+            "en": {"step1": step("Step 1", "Date of Birth (DD/MM/YYYY)/ जन्म तिथि", "Required", ["Use DD/MM/YYYY"])},
+            "hi": {"step1": step("चरण 1", "जन्म तिथि", "आवश्यक", ["DD/MM/YYYY लिखें"])},
+        }
+
+        table = detailed.build_i18n_table(detailed.merge_language_variants(variants))
+
+        self.assertEqual(table["en"]["dobLabel"], "Date of Birth (DD/MM/YYYY)")
+        self.assertEqual(table["hi"]["dobLabel"], "जन्म तिथि")
+        self.assertEqual(table["hi"]["dobMessage"], "आवश्यक")
+        self.assertEqual(table["en"]["step1Title"], "Step 1")
+        self.assertEqual(table["en"]["step1Instructions"], ["Use DD/MM/YYYY"])
+        self.assertEqual(table["en"]["nextBtnText"], "Next")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from array import array
+from datetime import datetime, timedelta, timezone
+
+from script_loader import load_script
+
+dedup = load_script("dedup-registrations.py")
+
+BASE_TIME = datetime(2025, 1, 8, 12, 0, tzinfo=timezone.utc)
+
+class FakeConnection:
+    def close(self):
+        pass
+
+class InMemoryIndex(dedup.RegistrationDedupIndex):
+    """Dedup index over an in-memory submissions table instead of Postgres"""
+
+    def __init__(self, index_dir, submissions, **options):
+        super().__init__(index_dir=index_dir, hash_key="test-key", safety_lag_seconds=300, **options)
+        # (aadhaar, pan, created_at, id) rows
+        self.submissions = submissions
+        self.confirm_calls = []
+
+    def connect(self):
+        return FakeConnection()
+
+    def count_submissions(self, connection):
+        return len(self.submissions)
+
+    def iter_submissions(self, connection, after_at=None, after_id=""):
+        after = (datetime.fromisoformat(after_at), after_id) if after_at else None
+        for row in sorted(self.submissions, key=lambda row: (row[2], row[3])):
+            if after is None or (row[2], row[3]) > after:
+                yield row
+
+    def confirm(self, pairs, since=None):
+        self.confirm_calls.append((list(pairs), since))
+        registered = {
+            dedup.normalize_pair(row[0], row[1])
+            for row in self.submissions
+            if since is None or row[2] >= since
+        }
+        return {pair for pair in pairs if pair in registered}
+
+def submission(number, minutes, pan="ABCDE1234F"):
+    return (f"{100000000000 + number}", pan, BASE_TIME + timedelta(minutes=minutes), f"id{number:04d}")
+
+class SortedKeysTest(unittest.TestCase):
+    def test_runs_merge_into_one_sorted_deduplicated_array(self):
+        runs = dedup.SortedRuns(chunk_size=3)
+        for value in [9, 1, 5, 5, 7, 3, 2**64 - 1, 0]:
+            runs.add(value)
+
+        merged = runs.merged_with()
+
+        self.assertIsInstance(merged, array)
+        self.assertEqual(list(merged), [0, 1, 3, 5, 7, 9, 2**64 - 1])
+
+    def test_new_keys_merge_into_existing_array(self):
+        runs = dedup.SortedRuns()
+        for value in [4, 1, 10]:
+            runs.add(value)
+
+        merged = runs.merged_with(array("Q", [1, 3, 8]))
+
+        self.assertEqual(list(merged), [1, 3, 4, 8, 10])
+
+class BloomFilterTest(unittest.TestCase):
+    def test_added_keys_are_always_found(self):
+        index = dedup.RegistrationDedupIndex(hash_key="test-key")
+        bloom = dedup.BloomFilter.for_capacity(1000, 0.01)
+        digests = [index.digest(str(100000000000 + i), "ABCDE1234F") for i in range(1000)]
+        for digest in digests:
+            bloom.add(digest)
+
+        self.assertTrue(all(digest in bloom for digest in digests))
+
+    def test_false_positive_rate_stays_near_target(self):
+        index = dedup.RegistrationDedupIndex(hash_key="test-key")
+        bloom = dedup.BloomFilter.for_capacity(1000, 0.01)
+        for i in range(1000):
+            bloom.add(index.digest(str(100000000000 + i), "ABCDE1234F"))
+
+        false_positives = sum(index.digest(str(200000000000 + i), "ABCDE1234F") in bloom for i in range(5000))
+
+        self.assertLess(false_positives / 5000, 0.03)
+
+class RegistrationDedupIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.submissions = [submission(i, i) for i in range(5)]
+        self.index = InMemoryIndex(self.tmp.name, self.submissions)
+        self.quietly(self.index.build, capacity=1000)
+
+    def quietly(self, method, *args, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return method(*args, **kwargs)
+
+    def reload(self, **options):
+        index = InMemoryIndex(self.tmp.name, self.submissions, **options)
+        index.load()
+        return index
+
+    def test_build_persists_index_and_watermark(self):
+        index = self.reload()
+
+        self.assertEqual(index.meta["count"], 5)
+        self.assertEqual(index.meta["watermark_id"], "id0004")
+        self.assertEqual(len(index.keys), 5)
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["bloom.bin", "keys.bin", "meta.json"])
+
+    def test_update_adds_only_rows_past_the_watermark(self):
+        self.submissions.append(submission(5, 10))
+        index = self.reload()
+
+        added = self.quietly(index.update)
+        index = self.reload()
+
+        self.assertEqual(added, 1)
+        self.assertEqual(index.meta["count"], 6)
+        self.assertEqual(index.meta["watermark_id"], "id0005")
+        self.assertEqual(list(index.keys), sorted(index.keys))
+        self.assertEqual(self.quietly(index.update), 0)
+
+    def test_index_built_with_another_key_is_rejected(self):
+        index = dedup.RegistrationDedupIndex(index_dir=self.tmp.name, hash_key="other-key")
+
+        with self.assertRaises(RuntimeError):
+            index.load()
+
+    def test_build_refuses_without_hash_key(self):
+        index = dedup.RegistrationDedupIndex(index_dir=self.tmp.name, hash_key="")
+
+        with self.assertRaises(RuntimeError):
+            index.build()
+
+    def test_check_batch_flags_registered_and_repeated_pairs(self):
+        index = self.reload()
+        registered = (self.submissions[0][0], "abcde1234f")
+        fresh = ("999999999999", "ZZZZZ9999Z")
+
+        new_pairs, duplicates = index.check_batch([registered, fresh, fresh])
+
+        self.assertEqual(new_pairs, [fresh])
+        self.assertEqual(duplicates, [(self.submissions[0][0], "ABCDE1234F"), fresh])
+
+    def test_check_batch_confirms_misses_against_the_index_tail(self):
+        # Registered after the last update, so the index can't know about it
+        late = submission(6, 20)
+        self.submissions.append(late)
+        index = self.reload()
+
+        new_pairs, duplicates = index.check_batch([(late[0], late[1])])
+
+        self.assertEqual(new_pairs, [])
+        self.assertEqual(duplicates, [(late[0], late[1])])
+        tail_call = index.confirm_calls[-1]
+        self.assertEqual(tail_call[1], self.submissions[4][2] - timedelta(seconds=300))
+
+    def test_save_leaves_no_temporary_files(self):
+        self.reload().save()
+
+        self.assertFalse([name for name in os.listdir(self.tmp.name) if name.endswith(".tmp")])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import ThreadingHTTPServer
+
+from script_loader import has_module, load_script
+
+fault_server = load_script("fault-injecting-server.py")
+
+@unittest.skipUnless(has_module("requests") and has_module("bs4"), "requests and beautifulsoup4 are required")
+class FetchResilienceTest(unittest.TestCase):
+    """Runs UdyamFormScraper against a local fault-injecting server"""
+
+    def setUp(self):
+        self.scraper_module = load_script("scrape-udyam-form.py")
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state_dir = tmp.name
+
+    def tearDown(self):
+        if getattr(self, "server", None):
+            self.server.shutdown()
+            self.server.server_close()
+
+    def serve(self, mode, **options):
+        handler = type("Handler", (fault_server.FaultInjectingHandler,), {
+            "mode": mode,
+            "request_count": 0,
+            "log_message": lambda self, format, *args: None,
+            **options,
+        })
+        self.handler = handler
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self.server.server_address[1]}/"
+
+    def scraper(self, url, **fetch_options):
+        options = {"backoff_base": 0.01, "backoff_max": 0.05, **fetch_options}
+        fetcher = self.scraper_module.ResilientFetcher(**options)
+        return self.scraper_module.UdyamFormScraper(form_url=url, state_dir=self.state_dir, fetcher=fetcher)
+
+    def scrape(self, scraper):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return scraper.scrape_form_structure()
+
+    def metrics(self):
+        with open(os.path.join(self.state_dir, "fetch-metrics.jsonl"), "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_live_scrape_saves_last_good(self):
+        data = self.scrape(self.scraper(self.serve("ok")))
+
+        self.assertEqual([field["id"] for field in data["steps"][0]["fields"]], ["txtadharno", "otp"])
+        self.assertEqual([field["id"] for field in data["steps"][1]["fields"]], ["txtPan", "applicant_name"])
+        self.assertEqual(self.metrics()[-1]["outcome"], "live")
+        self.assertTrue(os.path.exists(os.path.join(self.state_dir, "last-good-structure.json")))
+
+    def test_errors_open_breaker_after_three_runs(self):
+        url = self.serve("ok")
+        live = self.scrape(self.scraper(url))
+        self.handler.mode = "error"
+
+        for _ in range(3):
+            self.scrape(self.scraper(url))
+        requests_before = self.handler.request_count
+
+        scraper = self.scraper(url)
+        data = self.scrape(scraper)
+
+        self.assertEqual(scraper.breaker.status, "open")
+        self.assertEqual(self.handler.request_count, requests_before)
+        self.assertEqual(data["steps"], live["steps"])
+        self.assertEqual(self.metrics()[-1]["outcome"], "fallback_cache")
+        self.assertEqual(self.metrics()[-1]["reason"], "circuit open")
+
+    def test_flaky_portal_recovers_through_retries(self):
+        url = self.serve("recover", failures=2)
+        scraper = self.scraper(url, max_attempts=3)
+
+        data = self.scrape(scraper)
+
+        self.assertTrue(data["steps"])
+        self.assertEqual(self.metrics()[-1]["outcome"], "live")
+        self.assertEqual(self.metrics()[-1]["attempts"], 3)
+        self.assertEqual(scraper.breaker.status, "closed")
+
+    def test_slow_portal_stops_within_total_timeout(self):
+        url = self.serve("slow", delay=10)
+        scraper = self.scraper(url, read_timeout=1, total_timeout=2)
+
+        started = time.time()
+        data = self.scrape(scraper)
+        elapsed = time.time() - started
+
+        self.assertLess(elapsed, 3.5)
+        self.assertEqual(self.metrics()[-1]["outcome"], "fallback_static")
+        self.assertEqual(data["metadata"]["note"], "Fallback structure used")
+
+    def test_connect_and_read_timeouts_are_capped_by_total_timeout(self):
+        import requests
+
+        timeouts = []
+
+        class TimingOutSession:
+            def get(self, url, timeout):
+                timeouts.append(timeout)
+                raise requests.ConnectTimeout("timed out")
+
+        fetcher = self.scraper_module.ResilientFetcher(connect_timeout=3, read_timeout=10, total_timeout=1, max_attempts=1)
+        fetcher._session = TimingOutSession()
+
+        with self.assertRaises(self.scraper_module.FetchError):
+            fetcher.get("http://127.0.0.1:9/")
+
+        self.assertLessEqual(max(timeouts[0]), 1)
+
+    def assert_maintenance_counts_as_failure(self, mode):
+        url = self.serve("ok")
+        live = self.scrape(self.scraper(url))
+        self.handler.mode = mode
+
+        scraper = self.scraper(url)
+        data = self.scrape(scraper)
+
+        self.assertEqual(data["steps"], live["steps"])
+        self.assertEqual(self.metrics()[-1]["outcome"], "fallback_cache")
+        self.assertEqual(self.metrics()[-1]["reason"], "form inputs missing")
+        self.assertEqual(scraper.breaker.state["failures"], 1)
+
+    def test_maintenance_page_counts_as_failure(self):
+        self.assert_maintenance_counts_as_failure("maintenance")
+
+    def test_maintenance_page_inside_form_counts_as_failure(self):
+        self.assert_maintenance_counts_as_failure("maintenance-form")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import contextlib
+import gzip
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from script_loader import load_script
+
+scraper_module = load_script("scrape-udyam-form.py")
+
+def form_structure(scraped_at, label="Aadhaar Number"):
+    return {
+        "metadata": {"source_url": "https://udyamregistration.gov.in/UdyamRegistration.aspx", "scraped_at": scraped_at},
+        "steps": [{"step": 1, "fields": [{"id": "aadhaar", "label": label}]}],
+    }
+
+class PublishJsonTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.output_dir = self.tmp.name
+        self.scraper = scraper_module.UdyamFormScraper(state_dir=os.path.join(self.tmp.name, "state"))
+
+    def publish(self, data, **options):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.scraper.publish_json(data, self.output_dir, **options)
+
+    def path(self, filename):
+        return os.path.join(self.output_dir, filename)
+
+    def test_hash_ignores_scraped_at(self):
+        first = self.publish(form_structure("2025-01-08 10:00:00"))
+        second = self.publish(form_structure("2025-01-09 10:00:00"))
+        changed = self.publish(form_structure("2025-01-09 10:00:00", label="Aadhaar No."))
+
+        self.assertEqual(first["file"], second["file"])
+        self.assertNotEqual(first["file"], changed["file"])
+
+    def test_damaged_gzip_variant_is_rewritten(self):
+        manifest = self.publish(form_structure("2025-01-08 10:00:00"))
+        gz_path = self.path(manifest["variants"]["gzip"])
+        with open(gz_path, "wb") as f:
+            f.write(b"truncated")
+
+        self.publish(form_structure("2025-01-08 10:00:00"))
+
+        with open(self.path(manifest["file"]), "rb") as f:
+            payload = f.read()
+        with open(gz_path, "rb") as f:
+            self.assertEqual(gzip.decompress(f.read()), payload)
+        self.assertEqual(json.loads(payload)["steps"][0]["fields"][0]["label"], "Aadhaar Number")
+
+    def test_old_versions_are_pruned_to_keep(self):
+        published = []
+        base = time.time() - 3600
+        for i in range(5):
+            manifest = self.publish(form_structure("2025-01-08 10:00:00", label=f"Label {i}"), keep=2)
+            # Distinct mtimes, oldest first, regardless of filesystem timestamp resolution
+            os.utime(self.path(manifest["file"]), (base + i, base + i))
+            published.append(manifest["file"])
+
+        remaining = sorted(entry for entry in os.listdir(self.output_dir) if entry.endswith(".json") and ".manifest" not in entry)
+
+        self.assertEqual(remaining, sorted(published[-2:]))
+        self.assertFalse(os.path.exists(self.path(published[0] + ".gz")))
+        self.assertFalse([entry for entry in os.listdir(self.output_dir) if entry.endswith(".tmp")])
+
+if __name__ == "__main__":
+    unittest.main()
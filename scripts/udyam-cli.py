@@ -0,0 +1,156 @@
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Only the standard library is imported here; each subcommand loads its
+# script (and requests/BeautifulSoup/selenium through it) when it runs
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+COMMAND_SCRIPTS = {
+    "scrape-basic": "scrape-udyam-form.py",
+    "scrape-detailed": "scrape-udyam-detailed.py",
+    "analyze": "analyze-scraped-data.py",
+    "publish": "scrape-udyam-form.py",
+}
+
+def load_script(filename):
+    """Import a sibling script by file name (the scripts use hyphenated names)"""
+    module_name = filename[:-3].replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(SCRIPTS_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def run_scrape_basic(args):
+    module = load_script(COMMAND_SCRIPTS["scrape-basic"])
+    module.main(
+        output=args.output,
+        publish_dir=None if args.no_publish else args.publish_dir,
+        form_url=args.url,
+        state_dir=args.state_dir,
+    )
+
+def run_scrape_detailed(args):
+    module = load_script(COMMAND_SCRIPTS["scrape-detailed"])
+    module.main(output=args.output, bilingual=args.bilingual, i18n_output=args.i18n_output)
+
+def run_analyze(args):
+    module = load_script(COMMAND_SCRIPTS["analyze"])
+    module.analyze_scraped_data(args.input)
+
+def run_publish(args):
+    module = load_script(COMMAND_SCRIPTS["publish"])
+    with open(args.input, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    module.UdyamFormScraper().publish_json(data, args.output_dir)
+
+def run_fetch_stats(args):
+    module = load_script(COMMAND_SCRIPTS["scrape-basic"])
+    metrics = module.FetchMetrics(os.path.join(args.state_dir, "fetch-metrics.jsonl"))
+    breaker = module.CircuitBreaker(os.path.join(args.state_dir, "circuit.json"))
+    print(json.dumps({"circuit": breaker.status, **metrics.summary()}, indent=2))
+
+def run_startup_times(args):
+    """Measure cold-start time of each subcommand in fresh interpreters"""
+    commands = args.commands or list(COMMAND_SCRIPTS)
+    unknown = [command for command in commands if command not in COMMAND_SCRIPTS]
+    if unknown:
+        raise SystemExit(f"Unknown subcommand: {', '.join(unknown)}")
+    print(f"Cold-start times over {args.runs} runs (load only, no network):")
+
+    for command in commands:
+        samples = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--load-only", command],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            samples.append((time.perf_counter() - start) * 1000)
+            if result.returncode != 0:
+                break
+
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error"
+            print(f"  {command:<16} failed: {error}")
+            continue
+        print(f"  {command:<16} median {statistics.median(samples):7.1f} ms   max {max(samples):7.1f} ms")
+
+def load_only(command):
+    """Do the imports a subcommand needs before its first network call, then exit"""
+    module = load_script(COMMAND_SCRIPTS[command])
+    if command == "scrape-basic":
+        module.UdyamFormScraper().session
+        import bs4  # noqa: F401
+    elif command == "scrape-detailed":
+        import bs4  # noqa: F401
+        # Same as setup_driver(): without selenium the scraper runs on its fallback data
+        try:
+            from selenium import webdriver  # noqa: F401
+            from selenium.webdriver.chrome.options import Options  # noqa: F401
+        except ImportError:
+            pass
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Udyam form scraping tools")
+    parser.add_argument("--load-only", choices=list(COMMAND_SCRIPTS), help=argparse.SUPPRESS)
+    subparsers = parser.add_subparsers(dest="command")
+
+    basic = subparsers.add_parser("scrape-basic", help="Scrape the form structure with requests/BeautifulSoup")
+    basic.add_argument("--output", default="public/udyam-form-structure.json")
+    basic.add_argument("--publish-dir", default="public")
+    basic.add_argument("--no-publish", action="store_true", help="Skip writing hashed/precompressed copies")
+    basic.add_argument("--url", help="Form URL to fetch (e.g. a local fault-injecting server)")
+    basic.add_argument("--state-dir", default="data/scraper", help="Circuit breaker, last-good cache and fetch metrics")
+    basic.set_defaults(func=run_scrape_basic)
+
+    detailed = subparsers.add_parser("scrape-detailed", help="Scrape the portal with Selenium")
+    detailed.add_argument("--output", default="public/udyam-scraped-data.json")
+    detailed.add_argument("--bilingual", action="store_true", help="Scrape English and Hindi concurrently and merge them")
+    detailed.add_argument("--i18n-output", help="Write a per-language translation table (with --bilingual)")
+    detailed.set_defaults(func=run_scrape_detailed)
+
+    analyze = subparsers.add_parser("analyze", help="Summarize detailed scrape output")
+    analyze.add_argument("--input", default="public/udyam-scraped-data.json")
+    analyze.set_defaults(func=run_analyze)
+
+    publish = subparsers.add_parser("publish", help="Publish compact, precompressed, content-hashed form structure")
+    publish.add_argument("--input", default="public/udyam-form-structure.json")
+    publish.add_argument("--output-dir", default="public")
+    publish.set_defaults(func=run_publish)
+
+    stats = subparsers.add_parser("fetch-stats", help="Show circuit state, fallback frequency and fetch latency")
+    stats.add_argument("--state-dir", default="data/scraper")
+    stats.set_defaults(func=run_fetch_stats)
+
+    startup = subparsers.add_parser("startup-times", help="Measure cold-start time of each subcommand")
+    startup.add_argument("commands", nargs="*", metavar="command", help="Subcommands to measure (default: all)")
+    startup.add_argument("--runs", type=int, default=5)
+    startup.set_defaults(func=run_startup_times)
+
+    return parser
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if args.load_only:
+        load_only(args.load_only)
+        return
+    if not args.command:
+        parser.print_help()
+        return
+    args.func(args)
+
+if __name__ == "__main__":
+    main()